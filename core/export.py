@@ -0,0 +1,36 @@
+import csv
+import datetime
+
+import tzlocal
+
+CSV_FIELDS = {
+    "username": "Имя продавца",
+    "phone": "Номер телефона",
+    "profile_link": "Ссылка профиля",
+    "city": "Город",
+    "region": "Регион",
+    "city_id": "ID города",
+    "region_id": "ID региона",
+}
+
+
+def timestamp():
+    return (
+        datetime.datetime.now()
+        .astimezone(tzlocal.get_localzone())
+        .strftime("%d.%m.%Y_%H_%M_%S")
+    )
+
+
+def save_csv(data: list[dict], folder, prefix: str = "export"):
+    folder.mkdir(parents=True, exist_ok=True)
+    filename = folder / f"{prefix}_{timestamp()}.csv"
+    with open(filename, "w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=list(CSV_FIELDS.values()))
+        writer.writeheader()
+        for user_data in data:
+            writer.writerow(
+                {column: user_data.get(key, "") for key, column in CSV_FIELDS.items()}
+            )
+
+    return filename
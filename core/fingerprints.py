@@ -0,0 +1,116 @@
+import heapq
+import re
+from contextlib import ExitStack
+from pathlib import Path
+from threading import Lock
+from urllib.parse import urlparse
+
+from core.paths import RESULTS
+
+FINGERPRINT_FILE = "fingerprints.txt"
+HISTORY_FILE = RESULTS / "fingerprints_history.txt"
+
+_history_lock = Lock()
+
+
+def normalize_phone(phone: str | None) -> str:
+    phone = re.sub(r"\D", "", phone or "")
+    if not phone:
+        return ""
+    phone = re.sub(r"^0", "", phone)
+    if not phone.startswith("380"):
+        phone = "380" + phone
+    return phone
+
+
+def normalize_link(link: str | None) -> str:
+    if not link:
+        return ""
+    obj = urlparse(link.strip())
+    host = obj.netloc.lower().removeprefix("www.")
+    return f"{host}{obj.path.rstrip('/')}"
+
+
+def record_keys(record: dict) -> list[str]:
+    keys = []
+    phone = normalize_phone(record.get("phone"))
+    if phone:
+        keys.append(f"phone:{phone}")
+    link = normalize_link(record.get("profile_link"))
+    if link:
+        keys.append(f"link:{link}")
+    return keys
+
+
+def merge_sorted(path: Path, keys) -> Path:
+    # Two-way streaming merge of an existing sorted file with sorted keys,
+    # written through a tmp file so a crash never leaves a partial file.
+    tmp = path.with_suffix(".tmp")
+    with ExitStack() as stack:
+        sources = [keys]
+        if path.exists():
+            sources.append(iter_keys(stack.enter_context(open(path, encoding="utf-8"))))
+        with open(tmp, "w", encoding="utf-8") as out:
+            last = None
+            for key in heapq.merge(*sources):
+                if key != last:
+                    out.write(f"{key}\n")
+                    last = key
+    tmp.replace(path)
+    return path
+
+
+def write_fingerprints(data: list[dict], folder: Path) -> Path:
+    folder.mkdir(parents=True, exist_ok=True)
+    keys = sorted({key for record in data for key in record_keys(record)})
+    # A resumed job writes into the same folder with only the records
+    # collected since the restart, so earlier keys are merged back in.
+    return merge_sorted(folder / FINGERPRINT_FILE, keys)
+
+
+def fold_into_history(folder: Path) -> Path | None:
+    run = folder / FINGERPRINT_FILE
+    if not run.exists():
+        return None
+    with _history_lock, open(run, encoding="utf-8") as file:
+        RESULTS.mkdir(parents=True, exist_ok=True)
+        return merge_sorted(HISTORY_FILE, iter_keys(file))
+
+
+def iter_keys(file):
+    for line in file:
+        key = line.rstrip("\n")
+        if key:
+            yield key
+
+
+def seen_keys(keys: list[str], path: Path | None = None) -> set[str]:
+    # Both sides are sorted, so one pass over the history finds every match
+    # without loading it into memory.
+    path = path or HISTORY_FILE
+    seen = set()
+    if not keys or not path.exists():
+        return seen
+
+    with open(path, encoding="utf-8") as file:
+        i = 0
+        for old in iter_keys(file):
+            while i < len(keys) and keys[i] < old:
+                i += 1
+            if i == len(keys):
+                break
+            if keys[i] == old:
+                seen.add(old)
+
+    return seen
+
+
+def new_records(data: list[dict]) -> list[dict]:
+    keys = sorted({key for record in data for key in record_keys(record)})
+    with _history_lock:
+        seen = seen_keys(keys)
+    return [
+        record
+        for record in data
+        if not any(key in seen for key in record_keys(record))
+    ]
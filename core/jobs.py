@@ -0,0 +1,121 @@
+import json
+import uuid
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from threading import Lock
+from urllib.parse import urlparse
+
+from core.paths import RESULTS, ROOT_DIR
+
+JOBS_FILE = ROOT_DIR / "jobs.json"
+JOBS_DIR = ROOT_DIR / "jobs"
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+@dataclass
+class Job:
+    id: str
+    url: str
+    status: str = PENDING
+    error: str = ""
+
+    @property
+    def state_path(self) -> Path:
+        return JOBS_DIR / self.id / "state.json"
+
+    @property
+    def results_folder(self) -> Path:
+        return RESULTS / self.id
+
+
+class JobQueue:
+
+    def __init__(self, path: Path = JOBS_FILE):
+        self.path = path
+        self.jobs: list[Job] = []
+        self._lock = Lock()
+        self.load()
+
+    def load(self):
+        with self._lock:
+            if not self.path.exists():
+                self.jobs = []
+                return
+            data = json.loads(self.path.read_text())
+            self.jobs = [Job(**job) for job in data]
+
+    def reset_interrupted(self):
+        # Only valid at app start: a job left as running was interrupted by a
+        # restart, its checkpoint is still on disk and it resumes from there.
+        with self._lock:
+            for job in self.jobs:
+                if job.status == RUNNING:
+                    job.status = PENDING
+            self._save()
+
+    def save(self):
+        with self._lock:
+            self._save()
+
+    def _save(self):
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps([asdict(job) for job in self.jobs], ensure_ascii=False, indent=2)
+        )
+        tmp.replace(self.path)
+
+    def add(self, url: str) -> Job | None:
+        url = url.strip()
+        obj = urlparse(url)
+        if obj.scheme not in ("http", "https") or not obj.netloc:
+            return None
+        with self._lock:
+            job = Job(id=uuid.uuid4().hex[:8], url=url)
+            self.jobs.append(job)
+            self._save()
+        return job
+
+    def add_from_file(self, path: Path) -> list[Job]:
+        added = []
+        for line in Path(path).read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            job = self.add(line)
+            if job is not None:
+                added.append(job)
+        return added
+
+    def next_job(self) -> Job | None:
+        with self._lock:
+            for job in self.jobs:
+                if job.status == PENDING:
+                    return job
+        return None
+
+    def set_status(self, job: Job, status: str, error: str = ""):
+        with self._lock:
+            job.status = status
+            job.error = error
+            self._save()
+
+    def retry_failed(self):
+        with self._lock:
+            for job in self.jobs:
+                if job.status == FAILED:
+                    job.status = PENDING
+                    job.error = ""
+            self._save()
+
+    def clear_finished(self):
+        with self._lock:
+            self.jobs = [job for job in self.jobs if job.status != DONE]
+            self._save()
+
+    def snapshot(self) -> list[dict]:
+        with self._lock:
+            return [asdict(job) for job in self.jobs]
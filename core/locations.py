@@ -0,0 +1,132 @@
+import csv
+import json
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+from core.export import CSV_FIELDS
+
+LOCATIONS_FILE = Path(__file__).parent / "data" / "locations.json"
+
+APOSTROPHES = re.compile(r"['`’ʼ‘\"]")
+SEPARATORS = re.compile(r"[\s\-–—.,()]+")
+REGION_MARK = "oblast"
+REGION_WORDS = {"область", "обл", "oblast", "region", "регіон", "регион"}
+STOPWORDS = {"м", "г", "місто", "город", "city", "смт", "пгт", "с", "село"}
+
+
+def normalize(value: str | None) -> str:
+    if not value:
+        return ""
+    value = value.split(",")[0].casefold().replace("ё", "е")
+    value = APOSTROPHES.sub("", value)
+    words = []
+    for word in SEPARATORS.split(value):
+        if not word or word in STOPWORDS:
+            continue
+        words.append(REGION_MARK if word in REGION_WORDS else word)
+    return " ".join(words)
+
+
+def strip_region_mark(key: str) -> str:
+    return " ".join(w for w in key.split() if w != REGION_MARK)
+
+
+class LocationIndex:
+
+    def __init__(self, data: dict):
+        self.names: dict[str, str] = {}
+        self.regions: dict[str, str] = {}
+        self.settlements: dict[str, dict[str, str]] = {}
+
+        for region in data["regions"]:
+            self.names[region["id"]] = region["name"]
+            for variant in [region["name"], *region["variants"]]:
+                self._add(self.regions, normalize(variant), region["id"], variant)
+
+        for settlement in data["settlements"]:
+            self.names[settlement["id"]] = settlement["name"]
+            for variant in [settlement["name"], *settlement["variants"]]:
+                key = strip_region_mark(normalize(variant))
+                by_region = self.settlements.setdefault(key, {})
+                self._add(by_region, settlement["region"], settlement["id"], variant)
+
+    @staticmethod
+    def _add(index: dict, key: str, value: str, variant: str):
+        if index.get(key, value) != value:
+            raise ValueError(
+                f"Location variant {variant!r} maps to both {index[key]} and {value}"
+            )
+        index[key] = value
+
+    def region_id(self, region: str | None) -> str | None:
+        # "Kyiv Oblast" and "Kyiv" are different places, so the oblast marker
+        # is only dropped when the exact spelling is not in the index.
+        key = normalize(region)
+        return self.regions.get(key) or self.regions.get(strip_region_mark(key))
+
+    def settlement_id(self, city: str | None, region_id: str | None = None):
+        by_region = self.settlements.get(strip_region_mark(normalize(city)))
+        if not by_region:
+            return None
+        if region_id is not None:
+            # A same-name place in another oblast is a different settlement.
+            return by_region.get(region_id)
+        if len(by_region) == 1:
+            return next(iter(by_region.values()))
+        return None
+
+    def canonicalize(self, city: str | None, region: str | None) -> dict:
+        region_id = self.region_id(region)
+        city_id = self.settlement_id(city, region_id)
+        return {
+            "city": self.names.get(city_id, city or ""),
+            "region": self.names.get(region_id, region or ""),
+            "city_id": city_id or "",
+            "region_id": region_id or "",
+        }
+
+
+@lru_cache(maxsize=1)
+def load_index(path: Path = LOCATIONS_FILE) -> LocationIndex:
+    return LocationIndex(json.loads(path.read_text(encoding="utf-8")))
+
+
+def canonicalize(city: str | None, region: str | None) -> dict:
+    return load_index().canonicalize(city, region)
+
+
+def canonicalize_csv(path: Path) -> Path:
+    columns = {column: key for key, column in CSV_FIELDS.items()}
+    output = path.with_name(f"{path.stem}_canonical{path.suffix}")
+    index = load_index()
+
+    with (
+        open(path, newline="", encoding="utf-8") as src,
+        open(output, "w", newline="", encoding="utf-8") as dst,
+    ):
+        writer = csv.DictWriter(dst, fieldnames=list(CSV_FIELDS.values()))
+        writer.writeheader()
+        for row in csv.DictReader(src):
+            record = {columns[k]: v for k, v in row.items() if k in columns}
+            record.update(index.canonicalize(record.get("city"), record.get("region")))
+            writer.writerow(
+                {column: record.get(key, "") for key, column in CSV_FIELDS.items()}
+            )
+
+    return output
+
+
+def main():
+    for arg in sys.argv[1:]:
+        path = Path(arg)
+        files = sorted(path.rglob("export_*.csv")) if path.is_dir() else [path]
+        for file in files:
+            if file.stem.endswith("_canonical"):
+                continue
+            print(f"{file} -> {canonicalize_csv(file)}")
+
+
+if __name__ == "__main__":
+    main()
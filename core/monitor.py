@@ -0,0 +1,195 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import asdict
+from threading import Event, Lock, Thread
+
+from aiohttp import web
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+RECENT_ERRORS = 50
+RATE_WINDOW = 5 * 60
+
+STATUS_PAGE = """<!DOCTYPE html>
+<html lang="ru">
+<head>
+<meta charset="utf-8">
+<title>parserOLX</title>
+<style>
+    body { font-family: monospace; margin: 2em; background: #111; color: #ddd; }
+    h2 { color: #8c8; }
+    table { border-collapse: collapse; }
+    td, th { border: 1px solid #444; padding: 2px 8px; text-align: left; }
+    .error { color: #e77; }
+</style>
+</head>
+<body>
+<h2>parserOLX</h2>
+<pre id="status">Загрузка...</pre>
+<h2>Задачи</h2>
+<table id="jobs"></table>
+<h2>Последние ошибки</h2>
+<div id="errors"></div>
+<script>
+function esc(value) {
+    const div = document.createElement("div");
+    div.textContent = value ?? "";
+    return div.innerHTML;
+}
+
+async function refresh() {
+    try {
+        const data = await (await fetch("/api/status")).json();
+        const { jobs, errors, ...status } = data;
+        document.getElementById("status").textContent = JSON.stringify(status, null, 2);
+        document.getElementById("jobs").innerHTML = jobs.map(
+            (j) => `<tr><td>${esc(j.id)}</td><td>${esc(j.status)}</td><td>${esc(j.url)}</td><td>${esc(j.error)}</td></tr>`
+        ).join("");
+        document.getElementById("errors").innerHTML = errors.slice().reverse().map(
+            (e) => `<div class="error">${esc(e.time)} ${esc(e.text)}</div>`
+        ).join("");
+    } catch (e) {
+        document.getElementById("status").textContent = "Нет связи с парсером";
+    }
+}
+refresh();
+setInterval(refresh, 2000);
+</script>
+</body>
+</html>
+"""
+
+
+class RunStats:
+
+    def __init__(self):
+        self._lock = Lock()
+        self.jobs_source = None
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.state = None
+            self.profile = None
+            self.running = False
+            self.completed = False
+            self.started_at = None
+            self.finished_at = None
+            self.cards = 0
+            self.results = 0
+            self.with_phone = 0
+            self.errors = deque(maxlen=RECENT_ERRORS)
+            self.error_count = 0
+            self._result_times = deque()
+
+    def begin(self, state):
+        self.reset()
+        with self._lock:
+            self.state = state
+            self.running = True
+            self.started_at = time.time()
+
+    def finish(self, completed: bool):
+        with self._lock:
+            self.running = False
+            self.completed = completed
+            self.finished_at = time.time()
+
+    def set_profile(self, profile):
+        with self._lock:
+            self.profile = profile
+
+    def card_done(self):
+        with self._lock:
+            self.cards += 1
+
+    def result_added(self, phone: str):
+        now = time.time()
+        with self._lock:
+            self.results += 1
+            if phone:
+                self.with_phone += 1
+            self._result_times.append(now)
+            while self._result_times and self._result_times[0] < now - RATE_WINDOW:
+                self._result_times.popleft()
+
+    def error(self, text: str):
+        with self._lock:
+            self.error_count += 1
+            self.errors.append({"time": time.strftime("%H:%M:%S"), "text": text})
+
+    def snapshot(self) -> dict:
+        now = time.time()
+        with self._lock:
+            elapsed = 0.0
+            if self.started_at is not None:
+                elapsed = (self.finished_at or now) - self.started_at
+            minutes = elapsed / 60
+            recent = sum(1 for t in self._result_times if t >= now - RATE_WINDOW)
+            snapshot = {
+                "running": self.running,
+                "completed": self.completed,
+                "profile": self.profile,
+                "state": asdict(self.state) if self.state is not None else None,
+                "elapsed_seconds": round(elapsed),
+                "cards": self.cards,
+                "results": self.results,
+                "results_with_phone": self.with_phone,
+                "cards_per_minute": round(self.cards / minutes, 2) if minutes else 0,
+                "results_per_minute": round(self.results / minutes, 2)
+                if minutes
+                else 0,
+                "recent_results_per_minute": round(recent / (RATE_WINDOW / 60), 2),
+                "error_count": self.error_count,
+                "errors": list(self.errors),
+            }
+        snapshot["jobs"] = self.jobs_source() if self.jobs_source else []
+        return snapshot
+
+
+stats = RunStats()
+
+
+class MonitorServer:
+
+    def __init__(self, run_stats: RunStats, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.stats = run_stats
+        self.host = host
+        self.port = port
+        self.error = None
+        self._ready = Event()
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}/"
+
+    def start(self, timeout: float = 5):
+        t = Thread(target=self._run, daemon=True)
+        t.start()
+        self._ready.wait(timeout)
+        return self.error
+
+    def _run(self):
+        try:
+            asyncio.run(self._serve())
+        except Exception as e:
+            self.error = e
+            self._ready.set()
+
+    async def _serve(self):
+        app = web.Application()
+        app.router.add_get("/", self.index)
+        app.router.add_get("/api/status", self.status)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, self.host, self.port)
+        await site.start()
+        self._ready.set()
+        await asyncio.Event().wait()
+
+    async def index(self, request):
+        return web.Response(text=STATUS_PAGE, content_type="text/html")
+
+    async def status(self, request):
+        return web.json_response(self.stats.snapshot())
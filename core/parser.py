@@ -1,6 +1,5 @@
 import json
 import platform
-import re
 import time
 from dataclasses import asdict, dataclass
 from pathlib import Path
@@ -12,6 +11,9 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from core.fingerprints import normalize_phone
+from core.locations import canonicalize
+from core.monitor import stats
 from core.paths import ROOT_DIR
 
 BASE_URL = "https://www.olx.ua"
@@ -46,9 +48,12 @@ class ParserState:
 
 class Parser:
 
-    def __init__(self, app):
+    def __init__(self, app, state_path: Path = ROOT_DIR / "state.json"):
         self.main_app = app
         self._running = False
+        self.completed = False
+        self.driver = None
+        self.state_path = state_path
         self.options = Options()
         self.state = ParserState()
         self.options.add_argument("--disable-blink-features=AutomationControlled")
@@ -78,8 +83,16 @@ class Parser:
         self.log_output(f"Loaded data: {self.state}")
         self.profiles = self.main_app.getSetting("profiles").copy()
         self.log_output(f"Активные профили: {self.profiles}")
+        self.completed = False
         self._running = True
+        stats.begin(self.state)
 
+        try:
+            self.run()
+        finally:
+            stats.finish(self.completed)
+
+    def run(self):
         while self._running:
             profile = None
             if len(self.profiles):
@@ -90,6 +103,7 @@ class Parser:
                 self.wait_time()
                 continue
 
+            stats.set_profile(profile)
             self.options.add_argument(f"--profile-directory={profile}")
             self.driver = webdriver.Chrome(options=self.options)
             self.fix_url()
@@ -98,6 +112,7 @@ class Parser:
 
             if not self.is_auth():
                 self.log_output(f"Текущий профиль {profile} не авторизован", 0)
+                stats.error(f"Профиль {profile} не авторизован")
                 print(f"Current profile [magenta]{profile}[/magenta] is not authorized")
                 self.stop()
                 continue
@@ -107,6 +122,7 @@ class Parser:
 
                 if self.state.page_number > self.total_pages:
                     self._running = False
+                    self.completed = True
                     self.stop()
                     break
 
@@ -132,11 +148,13 @@ class Parser:
                     self.process_cards(clean_cards)
                 except ValueError as e:
                     self.log_output(f"Пойман спам блок для профиля: {profile}: {e}", 0)
+                    stats.error(f"{profile}: {e}")
                     self.stop()
                     break
 
                 if self.next_page_button is None:
                     self._running = False
+                    self.completed = True
                     self.stop()
                     break
 
@@ -197,15 +215,11 @@ class Parser:
                     if self.is_spam():
                         raise ValueError("Profile catched spam block. Switching...")
 
-                    phone: str = self.get_phone()
-                    if phone:
-                        phone = re.sub(r"\D", "", phone)
-                        phone = re.sub(r"^0", "", phone)
-                        if not phone.startswith("380"):
-                            phone = "380" + phone
+                    phone = normalize_phone(self.get_phone())
                     user_name = self.get_user_name()
                     profile_link = self.get_user_profile_link()
-                    city, region = self.get_location()
+                    location = canonicalize(*self.get_location())
+                    city, region = location["city"], location["region"]
                     self.log_output(
                         (
                             f"Получены данные продавца: Номер телефона: [cyan]{phone}[/cyan],"
@@ -219,20 +233,22 @@ class Parser:
                             "username": user_name,
                             "phone": phone,
                             "profile_link": profile_link,
-                            "city": city,
-                            "region": region,
+                            **location,
                         }
                     )
+                    stats.result_added(phone)
                 finally:
                     self.close_current_tab()
 
                 self.state.card_index += 1
+                stats.card_done()
                 self.save_state()
                 time.sleep(5)
             except ValueError as e:
                 raise e
             except Exception as e:
                 self.log_output(f"Возникла ошибка: {e}", 1)
+                stats.error(str(e))
 
     def is_promo_card(self, card) -> bool:
         try:
@@ -411,14 +427,15 @@ class Parser:
         self.save_state()
 
     def load_state(self):
-        if not (ROOT_DIR / "state.json").exists():
+        if not self.state_path.exists():
             self.state = ParserState()
         else:
-            data = json.loads((ROOT_DIR / "state.json").read_text())
+            data = json.loads(self.state_path.read_text())
             self.state = ParserState(**data)
 
     def save_state(self):
-        (ROOT_DIR / "state.json").write_text(json.dumps(asdict(self.state)))
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        self.state_path.write_text(json.dumps(asdict(self.state)))
 
     def wait_time(self):
         wait_count = 30 * 60
@@ -2,6 +2,8 @@ import json
 
 from textual.app import App
 
+from core.jobs import JobQueue
+from core.monitor import DEFAULT_PORT, MonitorServer, stats
 from core.paths import ROOT_DIR
 from screens.main_menu import MainMenu
 
@@ -11,14 +13,31 @@ class ParserApp(App):
     def __init__(self):
         super().__init__()
         self.settings = json.loads((ROOT_DIR / "settings.json").read_text())
+        self.jobs = JobQueue()
+        self.jobs.reset_interrupted()
+        self.worker = None
+        stats.jobs_source = self.jobs.snapshot
+        self.monitor = MonitorServer(
+            stats, port=self.getSetting("monitor_port") or DEFAULT_PORT
+        )
 
     def on_mount(self):
+        error = self.monitor.start()
+        if error is not None:
+            self.notify(f"Мониторинг не запущен: {error}", severity="error")
+        else:
+            self.notify(f"Мониторинг: {self.monitor.url}")
         self.push_screen(MainMenu())
 
     async def closeApp(self):
         with open(ROOT_DIR / "settings.json", "w") as f:
             json.dump(self.settings, f)
 
+    def worker_alive(self):
+        # Both parser screens report into the same RunStats, so only one
+        # parsing thread may run at a time.
+        return self.worker is not None and self.worker.is_alive()
+
     def getSetting(self, key):
         return self.settings.get(key, None)
 
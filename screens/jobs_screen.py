@@ -0,0 +1,237 @@
+import datetime
+from pathlib import Path
+from threading import Thread
+
+import pyperclip
+from rich.table import Table
+from textual.containers import Container, Horizontal
+from textual.screen import Screen
+from textual.widgets import Button, Checkbox, Footer, Header, Input, RichLog, Static
+
+from core.export import save_csv
+from core.fingerprints import fold_into_history, new_records, write_fingerprints
+from core.jobs import DONE, FAILED, PENDING, RUNNING, Job
+from core.monitor import stats
+from core.parser import Parser
+from screens.parser_screen import StopParsingScreen
+
+STATUS_STYLES = {
+    PENDING: "yellow",
+    RUNNING: "cyan",
+    DONE: "green",
+    FAILED: "red",
+}
+
+
+class JobsScreen(Screen):
+    CSS = """
+        #jobs-buttons {
+            height: auto;
+            align-horizontal: center;
+        }
+
+        #jobs-table {
+            height: auto;
+            max-height: 50%;
+        }
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.queue = self.app.jobs
+        self.parser = None
+        self.data = []
+        self.current_job: Job | None = None
+        self._running = False
+        self._stopping = False
+
+    def compose(self):
+        yield Header(show_clock=True)
+        yield Container(
+            Static(self.render_jobs(), id="jobs-table"),
+            Input(
+                placeholder="Вставьте поисковую ссылку или путь к файлу со ссылками...",
+                compact=True,
+                id="input-job",
+            ),
+            Horizontal(
+                Button("Запустить очередь", variant="success", id="run-jobs"),
+                Button("Повторить неудачные", id="retry-jobs"),
+                Button("Очистить завершенные", variant="error", id="clear-jobs"),
+                id="jobs-buttons",
+            ),
+            Checkbox(
+                "Сохранять отдельно новые записи после каждой задачи",
+                value=bool(self.app.getSetting("delta_export")),
+                id="delta-export",
+            ),
+            RichLog(id="log-output", markup=True),
+            id="main-container",
+        )
+        yield Footer()
+
+    def on_mount(self):
+        self.query_one("#run-jobs", Button).disabled = self.app.worker_alive()
+
+    def render_jobs(self):
+        table = Table(title="Очередь парсинга", expand=True)
+        table.add_column("ID")
+        table.add_column("Статус")
+        table.add_column("URL", overflow="fold")
+        table.add_column("Ошибка")
+        for job in self.queue.snapshot():
+            style = STATUS_STYLES.get(job["status"], "white")
+            table.add_row(
+                job["id"],
+                f"[{style}]{job['status']}[/{style}]",
+                job["url"],
+                job["error"],
+            )
+        return table
+
+    def refresh_jobs(self):
+        self.query_one("#jobs-table", Static).update(self.render_jobs())
+
+    def on_input_submitted(self, event: Input.Submitted):
+        value = event.value.strip()
+        if not value:
+            return
+
+        path = Path(value).expanduser()
+        log = self.query_one("#log-output", RichLog)
+        if path.is_file():
+            added = self.queue.add_from_file(path)
+            log.write(f"[green]Добавлено задач из файла: {len(added)}[/green]")
+        elif self.queue.add(value) is None:
+            log.write(f"[red]Это не ссылка и не файл: {value}[/red]")
+            return
+        event.input.value = ""
+        self.refresh_jobs()
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "run-jobs":
+            if self.app.worker_alive():
+                self.query_one("#log-output", RichLog).write(
+                    "[red]Предыдущий парсинг еще не остановился[/red]"
+                )
+                return
+            self._running = True
+            self._stopping = False
+            event.button.disabled = True
+            self.app.worker = Thread(target=self._jobs_task, daemon=True)
+            self.app.worker.start()
+        elif event.button.id == "retry-jobs":
+            self.queue.retry_failed()
+            self.refresh_jobs()
+        elif event.button.id == "clear-jobs":
+            self.queue.clear_finished()
+            self.refresh_jobs()
+
+    def on_checkbox_changed(self, event: Checkbox.Changed) -> None:
+        if event.checkbox.id == "delta-export":
+            self.app.changeSettings("delta_export", event.value)
+
+    def _jobs_task(self):
+        while not self._stopping:
+            job = self.queue.next_job()
+            if job is None:
+                self.add_log_output("Очередь завершена")
+                break
+            self.run_job(job)
+
+        self._running = False
+        self.current_job = None
+        self.app.call_from_thread(self.jobs_ended)
+
+    def run_job(self, job: Job):
+        self.current_job = job
+        self.data = []
+        self.queue.set_status(job, RUNNING)
+        self.app.call_from_thread(self.refresh_jobs)
+        self.add_log_output(f"Задача [cyan]{job.id}[/cyan]: {job.url}")
+
+        self.parser = Parser(self.app, state_path=job.state_path)
+        proceed = job.state_path.exists()
+        error = ""
+        try:
+            try:
+                self.parser.start(job.url, self.add_log_output, self.add_data, proceed)
+            except Exception as e:
+                error = str(e)
+                if not self._stopping:
+                    stats.error(f"Задача {job.id}: {error}")
+
+            # Stopping the queue quits the driver from the UI thread, so the
+            # worker usually ends with a connection error: that is not a failure.
+            if self.parser.completed:
+                self.queue.set_status(job, DONE)
+            elif self._stopping:
+                self.queue.set_status(job, PENDING)
+            else:
+                if error:
+                    self.add_log_output(
+                        f"Задача {job.id} завершилась с ошибкой: {error}", 0
+                    )
+                self.queue.set_status(job, FAILED, error or "Парсинг прерван")
+        finally:
+            if self.data:
+                self.save_data()
+                if self.app.getSetting("delta_export"):
+                    self.save_new_data()
+            fold_into_history(job.results_folder)
+            self.app.call_from_thread(self.refresh_jobs)
+
+    def jobs_ended(self):
+        if not self.is_mounted:
+            return
+        self.query_one("#run-jobs", Button).disabled = False
+        self.refresh_jobs()
+
+    def add_data(self, data: dict) -> None:
+        self.data.append(data)
+        if len(self.data) % 15 == 0:
+            self.save_data()
+
+    def save_data(self):
+        if self.current_job is None:
+            return
+        filename = save_csv(self.data, self.current_job.results_folder)
+        write_fingerprints(self.data, self.current_job.results_folder)
+        self.add_log_output(f"Файл сохранен по пути [cyan]{filename}[/cyan]")
+
+    def save_new_data(self):
+        folder = self.current_job.results_folder
+        data = new_records(self.data)
+        filename = save_csv(data, folder, prefix="new")
+        self.add_log_output(
+            f"Новых записей: {len(data)}, файл сохранен по пути [cyan]{filename}[/cyan]"
+        )
+
+    def add_log_output(self, text: str, log_type: int = 1):
+        style = "green" if log_type == 1 else "red"
+        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+        self.app.call_from_thread(
+            lambda: self.query_one("#log-output", RichLog).write(
+                f"[dim]{timestamp}[/] [{style}]{text.strip()}[/{style}]"
+            )
+        )
+
+    def stop_jobs(self):
+        self._stopping = True
+        if self.parser is not None:
+            self.parser.close()
+
+    def on_key(self, event):
+        if event.key == "ctrl+v":
+            self.query_one("#input-job", Input).value = pyperclip.paste()
+        if event.key == "escape" and self._running:
+
+            def check_quit(finish: bool | None) -> None:
+                if finish:
+                    self.stop_jobs()
+
+            self.app.push_screen(StopParsingScreen(), check_quit)
+
+        elif event.key == "q" and not isinstance(self.focused, Input):
+            self.stop_jobs()
+            self.app.pop_screen()
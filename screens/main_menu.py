@@ -5,6 +5,7 @@ from textual.screen import Screen
 from textual.widgets import Footer, Header, OptionList, Static
 from textual.widgets.option_list import Option
 
+from screens.jobs_screen import JobsScreen
 from screens.parser_screen import ParserScreen
 from screens.profiles_screen import ProfilesScreen
 
@@ -22,6 +23,7 @@ class MainMenu(Screen):
         yield OptionList(
             Option("1. Управлять профилями", id="change_profiles"),
             Option("2. Начать парсинг", id="start_parsing"),
+            Option("3. Очередь парсинга", id="jobs"),
             Option("0. Выйти", id="exit"),
             name="menu",
         )
@@ -39,6 +41,8 @@ class MainMenu(Screen):
             self.app.push_screen(ProfilesScreen())
         elif selected_id == "start_parsing":
             self.app.push_screen(ParserScreen())
+        elif selected_id == "jobs":
+            self.app.push_screen(JobsScreen())
         elif selected_id == "exit":
             self.call_later(self.app.closeApp)
             self.app.exit()
@@ -1,14 +1,14 @@
-import csv
 import datetime
 import json
 from threading import Thread
 
 import pyperclip
-import tzlocal
 from textual.containers import Container, Grid
 from textual.screen import ModalScreen, Screen
 from textual.widgets import (Button, Footer, Header, Input, Label, RichLog, Static)
 
+from core.export import save_csv, timestamp
+from core.fingerprints import fold_into_history, new_records, write_fingerprints
 from core.parser import Parser
 from core.paths import RESULTS, ROOT_DIR
 
@@ -59,7 +59,7 @@ class StopParsingScreen(ModalScreen[bool]):
 
 class ParserScreen(Screen):
     CSS = """
-        #export-button {
+        #export-button, #export-new-button {
             background: green;
             padding: 0;
             margin: 1;
@@ -102,12 +102,10 @@ class ParserScreen(Screen):
         self.start_paring(url)
 
     def start_paring(self, url):
-        folder_name = str(
-            datetime.datetime.now()
-            .astimezone(tzlocal.get_localzone())
-            .strftime("%d.%m.%Y_%H_%M_%S")
-        )
-        self.results_folder = RESULTS / folder_name
+        if self.app.worker_alive():
+            self.notify("Предыдущий парсинг еще не остановился", severity="error")
+            return
+        self.results_folder = RESULTS / timestamp()
         self.results_folder.mkdir(parents=True, exist_ok=True)
         container = self.query_one("#main-container", Container)
         container.query_children("#input-link").remove()
@@ -128,11 +126,16 @@ class ParserScreen(Screen):
 
         container.mount(RichLog(id="log-output", markup=True))
         container.mount(Button("Экспорт в CSV", id="export-button"))
-        t = Thread(target=self._parser_task, args=(url,), daemon=True)
-        t.start()
+        container.mount(Button("Экспорт новых в CSV", id="export-new-button"))
+        self.app.worker = Thread(target=self._parser_task, args=(url,), daemon=True)
+        self.app.worker.start()
 
     def _parser_task(self, url):
-        self.parser.start(url, self.add_log_output, self.add_data, self.proceed)
+        try:
+            self.parser.start(url, self.add_log_output, self.add_data, self.proceed)
+        finally:
+            write_fingerprints(self.data, self.results_folder)
+            fold_into_history(self.results_folder)
 
     def add_data(self, data: dict) -> None:
         self.data.append(data)
@@ -154,6 +157,8 @@ class ParserScreen(Screen):
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "export-button":
             self.save_data()
+        elif event.button.id == "export-new-button":
+            self.save_new_data()
         elif event.button.id == "proceed":
             self.proceed = True
             data = json.loads((ROOT_DIR / "state.json").read_text())
@@ -163,36 +168,22 @@ class ParserScreen(Screen):
                 self.start_paring(None)
 
     def save_data(self):
-        if not RESULTS.exists():
-            RESULTS.mkdir(parents=True, exist_ok=True)
+        filename = save_csv(self.data, self.results_folder)
+        write_fingerprints(self.data, self.results_folder)
+        self.log_saved(filename)
 
-        filename = (
-            self.results_folder
-            / f'export_{datetime.datetime.now().astimezone(tzlocal.get_localzone()).strftime("%d.%m.%Y_%H_%M_%S")}.csv'
-        )
-        with open(filename, "w", newline="", encoding="utf-8") as file:
-            writer = csv.DictWriter(
-                file,
-                fieldnames=[
-                    "Имя продавца",
-                    "Номер телефона",
-                    "Ссылка профиля",
-                    "Город",
-                    "Регион",
-                ],
-            )
-            writer.writeheader()
-            for user_data in self.data:
-                writer.writerow(
-                    {
-                        "Имя продавца": user_data.get("username", ""),
-                        "Номер телефона": user_data.get("phone", ""),
-                        "Ссылка профиля": user_data.get("profile_link", ""),
-                        "Город": user_data.get("city", ""),
-                        "Регион": user_data.get("region", ""),
-                    }
-                )
+    def save_new_data(self):
+        data = list(self.data)
+        t = Thread(target=self._save_new_data_task, args=(data,), daemon=True)
+        t.start()
+
+    def _save_new_data_task(self, data):
+        write_fingerprints(data, self.results_folder)
+        data = new_records(data)
+        filename = save_csv(data, self.results_folder, prefix="new")
+        self.add_log_output(f"Файл сохранен по пути [cyan]{filename}[/cyan]")
 
+    def log_saved(self, filename):
         self.query_one("#log-output", RichLog).write(
             (
                 f"[dim]{datetime.datetime.now().strftime("%H:%M:%S")}[/]"